@@ -13,11 +13,44 @@ Usage:
 Author: Khanh
 Repository: fbundle.github.io
 """
-import sys; import os; sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 import argparse
 import os
 import pathlib
+import string
+
+
+def split_template(template: str) -> tuple[str, str]:
+    """
+    Split a page template into the text before and after its {content} placeholder.
+
+    The template is parsed with the same rules as str.format, so {{ }} escapes
+    are resolved in both halves and an escaped {{content}} is not a placeholder.
+
+    Args:
+        template (str): Template text containing exactly one {content} field
+
+    Returns:
+        tuple[str, str]: Template text before and after the placeholder
+
+    Raises:
+        ValueError: If the template does not contain exactly one plain {content} field
+    """
+    before: list[str] = []
+    after: list[str] = []
+    found = False
+    for literal_text, field_name, format_spec, conversion in string.Formatter().parse(template):
+        (after if found else before).append(literal_text)
+        if field_name is None:
+            continue
+        if field_name != "content" or format_spec or conversion is not None:
+            raise ValueError(f"unsupported template field {field_name!r}, only a plain {{content}} is allowed")
+        if found:
+            raise ValueError("template contains more than one {content} placeholder")
+        found = True
+
+    if not found:
+        raise ValueError("template must contain a {content} placeholder")
+    return "".join(before), "".join(after)
 
 
 def generate_pages(input_dir: str, output_dir: str, template_path: str) -> None:
@@ -37,7 +70,12 @@ def generate_pages(input_dir: str, output_dir: str, template_path: str) -> None:
         template_path (str): Path to the master HTML template file
     """
     # Read the master template that will wrap all page content
-    template: str = open(template_path).read()
+    with open(template_path, "r", encoding="utf-8") as f:
+        template: str = f.read()
+
+    # Split the template once around the {content} placeholder so each page
+    # is a plain concatenation instead of a full str.format pass
+    prefix, suffix = split_template(template)
 
     total_pages = 0
     
@@ -48,18 +86,19 @@ def generate_pages(input_dir: str, output_dir: str, template_path: str) -> None:
 
         # Read the page content and wrap it with template markers
         # These markers help identify where content should be inserted
-        content = "\n<!-- INSERT_CONTENT_BEGIN -->\n" + open(path).read() + "\n<!-- INSERT_CONTENT_END -->\n"
+        with open(path, "r", encoding="utf-8") as f:
+            content = "\n<!-- INSERT_CONTENT_BEGIN -->\n" + f.read() + "\n<!-- INSERT_CONTENT_END -->\n"
 
-        # Insert the wrapped content into the master template
-        # The template should have a {content} placeholder for this insertion
-        html = template.format(content=content)
+        # Insert the wrapped content between the template halves
+        html = prefix + content + suffix
 
         # Create the output file path, preserving directory structure
         output_path = os.path.join(output_dir, rel_path)
         # Ensure the output directory exists (create if needed)
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
         # Write the generated HTML to the output file
-        open(output_path, "w").write(html)
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.write(html)
 
         print(f"DEBUG: generated {output_path}")
         total_pages += 1
@@ -24,11 +24,20 @@ import sys; import os; sys.path.append(os.path.dirname(os.path.dirname(os.path.a
 import pydantic
 import argparse
 import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from operator import attrgetter
 
-from src.util.pdf_util import get_pdf_dates, get_pdf_text
+from src.util.pdf_util import get_pdf_info
 from src.util.util import HtmlPath
 
+# Descriptions are the first words of a PDF, read from at most this many pages
+DESCRIPTION_MAX_WORDS = 20
+DESCRIPTION_MAX_PAGES = 5
+
+# Bump whenever extract_pdf_info changes its output, so cached entries are re-extracted
+PDF_INFO_CACHE_VERSION = 1
+
 
 def datetime_to_str(dt: datetime) -> str:
     """
@@ -58,7 +67,117 @@ class DocInfo(pydantic.BaseModel):
     description: str             # Brief description extracted from document content
 
 
-def get_pdfs_from_dir(doc_htmldir: HtmlPath) -> dict[str, list[DocInfo]]:
+class PdfInfoCacheEntry(pydantic.BaseModel):
+    """
+    Cached extraction result for a single PDF.
+
+    An entry is only reused while the file's modification time and size
+    still match the values recorded when it was extracted.
+    """
+    mtime_ns: int                # st_mtime_ns of the PDF at extraction time
+    size: int                    # st_size of the PDF at extraction time
+    creation_date: datetime      # Extracted creation date
+    modified_date: datetime      # Extracted modification date
+    description: str             # Extracted brief description
+
+
+class PdfInfoCache(pydantic.BaseModel):
+    """
+    On-disk layout of the PDF info cache.
+
+    The header records how the entries were extracted; a cache written
+    with a different version or different extraction limits is discarded.
+    """
+    version: int                 # PDF_INFO_CACHE_VERSION at write time
+    max_words: int               # DESCRIPTION_MAX_WORDS at write time
+    max_pages: int               # DESCRIPTION_MAX_PAGES at write time
+    entries: dict[str, PdfInfoCacheEntry]  # Cached entries keyed by PDF path
+
+
+def new_pdf_info_cache() -> PdfInfoCache:
+    """
+    Create an empty PDF info cache for the current extraction settings.
+
+    Returns:
+        PdfInfoCache: Cache with the current header and no entries
+    """
+    return PdfInfoCache(
+        version=PDF_INFO_CACHE_VERSION,
+        max_words=DESCRIPTION_MAX_WORDS,
+        max_pages=DESCRIPTION_MAX_PAGES,
+        entries={},
+    )
+
+
+def load_pdf_info_cache(cache_path: str) -> dict[str, PdfInfoCacheEntry]:
+    """
+    Load the PDF info cache, keyed by PDF path.
+
+    A missing or unreadable cache file, or one written with different
+    extraction settings, is treated as an empty cache.
+
+    Args:
+        cache_path (str): Path to the JSON cache file
+
+    Returns:
+        dict[str, PdfInfoCacheEntry]: Cached entries keyed by PDF path
+    """
+    try:
+        with open(cache_path, "rb") as f:
+            cache = PdfInfoCache.model_validate_json(f.read())
+    except (OSError, pydantic.ValidationError):
+        return {}
+    if cache.model_dump(exclude={"entries"}) != new_pdf_info_cache().model_dump(exclude={"entries"}):
+        return {}
+    return cache.entries
+
+
+def save_pdf_info_cache(cache_path: str, entries: dict[str, PdfInfoCacheEntry]) -> None:
+    """
+    Write the PDF info cache to disk.
+
+    The cache is written to a temporary file and moved into place, so an
+    interrupted build leaves the previous cache intact.
+
+    Args:
+        cache_path (str): Path to the JSON cache file
+        entries (dict[str, PdfInfoCacheEntry]): Entries keyed by PDF path
+    """
+    cache = new_pdf_info_cache()
+    cache.entries = entries
+    os.makedirs(os.path.dirname(cache_path) or ".", exist_ok=True)
+    tmp_cache_path = cache_path + ".tmp"
+    with open(tmp_cache_path, "wb") as f:
+        f.write(cache.model_dump_json().encode("utf-8"))
+    os.replace(tmp_cache_path, cache_path)
+
+
+def extract_pdf_info(path: str) -> tuple[datetime, datetime, str]:
+    """
+    Extract dates and a brief description from a single PDF document.
+
+    Defined at module level so it can be pickled and run in worker processes.
+
+    Args:
+        path (str): Path to the PDF file
+
+    Returns:
+        tuple[datetime, datetime, str]: Creation date, modification date and description
+    """
+    # Extract creation/modification dates and text content with a single open
+    # The opening words are usually on the first page; scans without a text layer stop after a few pages
+    creation_date, modified_date, description = get_pdf_info(
+        path, max_words=DESCRIPTION_MAX_WORDS, max_pages=DESCRIPTION_MAX_PAGES,
+    )
+
+    # Create a brief description from the text content
+    # Take first DESCRIPTION_MAX_WORDS words and add ellipsis for brevity
+    description = " ".join(description.split()[:DESCRIPTION_MAX_WORDS]) + " ..."
+
+    return creation_date, modified_date, description
+
+
+def get_pdfs_from_dir(doc_htmldir: HtmlPath, cache_path: str | None = None) -> dict[str, list[DocInfo]]:
     """
     Scan directory structure and extract information from PDF documents.
     
@@ -67,56 +186,101 @@ def get_pdfs_from_dir(doc_htmldir: HtmlPath) -> dict[str, list[DocInfo]]:
     
     For example:
         docs/assets/public_doc/study_notes/calculus/main.pdf
+
+    PDF parsing is CPU-bound and independent per file, so it is fanned out
+    over a process pool once all documents have been found. When a cache
+    path is given, PDFs whose mtime and size are unchanged since the last
+    run are not parsed again.
     
     Args:
         doc_htmldir (HtmlPath): Path object representing the documents directory
+        cache_path (str | None): Optional path to a JSON cache of extracted PDF info
         
     Returns:
         dict[str, list[DocInfo]]: Dictionary mapping category names to lists of DocInfo objects
     """
     doc_info_dict: dict[str, list[DocInfo]] = {}
+    pending: list[tuple[str, str, str, HtmlPath, os.stat_result]] = []
     
     # Iterate through each category directory
-    for category in os.listdir(doc_htmldir.to_path()):
-        category_dir = f"{doc_htmldir.to_path()}/{category}"
-        if not os.path.isdir(category_dir):
-            continue
-            
+    # os.scandir exposes the entry type without an extra stat per entry
+    with os.scandir(doc_htmldir.to_path()) as category_it:
+        category_entries = [entry for entry in category_it if entry.is_dir()]
+
+    for category_entry in category_entries:
+        category = category_entry.name
+
         # Iterate through each project in the category
-        for name in os.listdir(category_dir):
+        with os.scandir(category_entry.path) as project_it:
+            project_entries = [entry for entry in project_it if entry.is_dir()]
+
+        for project_entry in project_entries:
+            name = project_entry.name
             # Construct path to main.pdf file
-            path = f"{category_dir}/{name}/main.pdf"
+            path = f"{project_entry.path}/main.pdf"
+
+            # Skip if main.pdf doesn't exist, the stat result is reused for the cache check
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+
             # Create HTML path for web access
             htmlpath = HtmlPath(
                 html_root_dir=doc_htmldir.html_root_dir,
                 htmlpath=f"{doc_htmldir.htmlpath}/{category}/{name}/main.pdf",
             )
-            
-            # Skip if main.pdf doesn't exist
-            if not os.path.exists(path):
-                continue
 
-            # Extract creation and modification dates from PDF
-            creation_date, modified_date = get_pdf_dates(path)
-
-            # Extract text content and create a brief description
-            description = get_pdf_text(path)
-            # Take first 20 words and add ellipsis for brevity
-            description = " ".join(description.split()[:20]) + " ..."
-
-            # Initialize category list if it doesn't exist
-            if category not in doc_info_dict:
-                doc_info_dict[category] = []
-
-            # Add document information to the category
-            doc_info_dict[category].append(DocInfo(
-                name=name,
-                category=category,
-                htmlpath=htmlpath,
-                creation_date=creation_date,
-                modified_date=modified_date,
-                description=description,
-            ))
+            pending.append((category, name, path, htmlpath, st))
+
+    # Reuse cached results for PDFs that have not changed since the last run
+    old_cache = load_pdf_info_cache(cache_path) if cache_path is not None else {}
+    new_cache: dict[str, PdfInfoCacheEntry] = {}
+    stale: list[tuple[str, os.stat_result]] = []
+    for _, _, path, _, st in pending:
+        entry = old_cache.get(path)
+        if entry is not None and entry.mtime_ns == st.st_mtime_ns and entry.size == st.st_size:
+            new_cache[path] = entry
+        else:
+            stale.append((path, st))
+
+    # Parse the remaining PDFs in parallel, results come back in submission order
+    # This must stay a process pool: PyMuPDF holds the GIL while parsing, so a
+    # thread pool would run the extraction one file at a time.
+    # Small chunks amortize the pickling round-trip without starving workers;
+    # every worker pays the pymupdf import, so never start more than needed
+    if stale:
+        max_workers = min(os.cpu_count() or 1, 8, len(stale))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(extract_pdf_info, [path for path, _ in stale], chunksize=4)
+            for (path, st), (creation_date, modified_date, description) in zip(stale, results):
+                new_cache[path] = PdfInfoCacheEntry(
+                    mtime_ns=st.st_mtime_ns,
+                    size=st.st_size,
+                    creation_date=creation_date,
+                    modified_date=modified_date,
+                    description=description,
+                )
+
+    if cache_path is not None:
+        save_pdf_info_cache(cache_path, new_cache)
+
+    for category, name, path, htmlpath, _ in pending:
+        entry = new_cache[path]
+
+        # Initialize category list if it doesn't exist
+        if category not in doc_info_dict:
+            doc_info_dict[category] = []
+
+        # Add document information to the category
+        doc_info_dict[category].append(DocInfo(
+            name=name,
+            category=category,
+            htmlpath=htmlpath,
+            creation_date=entry.creation_date,
+            modified_date=entry.modified_date,
+            description=entry.description,
+        ))
             
     return doc_info_dict
 
@@ -142,6 +306,7 @@ def generate_text_html(
         doc_htmldir: HtmlPath,
         text_template_path: str,
         text_output_path: str,
+        cache_path: str | None = None,
 ) -> None:
     """
     Generate HTML content for the text/posts page from academic documents.
@@ -157,37 +322,45 @@ def generate_text_html(
         doc_htmldir (HtmlPath): Path to the documents directory
         text_template_path (str): Path to the HTML template file
         text_output_path (str): Path where the final HTML will be saved
+        cache_path (str | None): Optional path to a JSON cache of extracted PDF info
     """
     # Get document information organized by category
-    doc_info_dict: dict[str, list[DocInfo]] = get_pdfs_from_dir(doc_htmldir)
+    doc_info_dict: dict[str, list[DocInfo]] = get_pdfs_from_dir(doc_htmldir, cache_path=cache_path)
 
-    content = ""
+    # Collect HTML fragments and join them once at the end
+    parts: list[str] = []
     
     # Generate HTML content for each category
     for category, item_list in doc_info_dict.items():
         # Add category header
-        content += "<h2>" + category + "</h2>"
+        parts.append("<h2>" + category + "</h2>")
 
         # Sort items by modification date (newest first)
-        item_list = sorted(item_list, key=lambda x: x.modified_date, reverse=True)
+        item_list = sorted(item_list, key=attrgetter("modified_date"), reverse=True)
 
         # Generate HTML for each document in the category
         for item in item_list:
-            content += f"""
+            parts.append(f"""
             <li>
                 <a href="{item.htmlpath}">{item.name}</a> {blur_html_text(f"(last compiled {datetime_to_str(item.modified_date)})")}
                 <br>
                 {blur_html_text(f"({item.description})")}
             </li>
-            """
+            """)
+
+    content = "".join(parts)
 
     # Read the HTML template and insert the generated content
-    html_template = open(text_template_path).read()
+    with open(text_template_path, "r", encoding="utf-8") as f:
+        html_template = f.read()
     html = html_template.format(public_doc_content=content)
     
-    # Write the final HTML to the output file
-    with open(text_output_path, "w") as f:
-        f.write(html)
+    # Write the final HTML to a temporary file and move it into place,
+    # so an interrupted build never leaves a half-written page behind
+    tmp_output_path = text_output_path + ".tmp"
+    with open(tmp_output_path, "wb") as f:
+        f.write(html.encode("utf-8"))
+    os.replace(tmp_output_path, text_output_path)
 
     # Print summary of generated content
     total_entries = sum(map(len, doc_info_dict.values()))
@@ -223,6 +396,12 @@ if __name__ == "__main__":
         required=True,
         help="Path where the generated text HTML will be saved"
     )
+    parser.add_argument(
+        "--cache_path", 
+        type=str, 
+        default=None,
+        help="Optional JSON cache of extracted PDF info, reused across builds"
+    )
     args = parser.parse_args()
 
     # Generate text HTML using the provided arguments
@@ -233,4 +412,5 @@ if __name__ == "__main__":
         ),
         text_template_path=args.text_template_path,
         text_output_path=args.text_output_path,
+        cache_path=args.cache_path,
     )
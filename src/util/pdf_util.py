@@ -1,20 +1,52 @@
+import itertools
 import re
 from datetime import datetime
 
 import pymupdf
 
+_WHITESPACE_RE = re.compile(r'\s+')
+_PDF_TZ_RE = re.compile(r'[+\-Z]')
 
-def get_pdf_dates(pdf_path: str) -> tuple[datetime, datetime]:
-    def parse_pdf_date(date_str: str) -> datetime | None:
-        if not date_str:
+
+def parse_pdf_date(date_str: str) -> datetime | None:
+    if not date_str:
+        return None
+    if date_str.startswith("D:"):
+        date_str = date_str[2:]  # Strip leading "D:" if present
+    date_str = _PDF_TZ_RE.split(date_str, maxsplit=1)[0]  # Remove the timezone part like +08'00' or Z
+    # The format is fixed-width, so plain int slicing avoids strptime's format parsing;
+    # every field after the year is optional in PDF dates and falls back to its minimum
+    s = date_str[:14]
+    # Check the digits up front, int() alone would also accept signs and whitespace
+    if len(s) < 4 or not (s.isascii() and s.isdigit()):
+        return None
+    if len(s) == 14:
+        # Common case of a complete date: one int() over all 14 digits, then split off
+        # two-digit fields with divmod instead of six separate slice + int() calls
+        n, second = divmod(int(s), 100)
+        n, minute = divmod(n, 100)
+        n, hour = divmod(n, 100)
+        n, day = divmod(n, 100)
+        year, month = divmod(n, 100)
+        try:
+            return datetime(year, month, day, hour, minute, second)
+        except ValueError:
             return None
-        if date_str.startswith("D:"):
-            date_str = date_str[2:]  # Strip leading "D:" if present
-        date_str = re.sub(r"[+-].*", "", date_str)  # Remove the timezone part like +08'00'
-        dt = datetime.strptime(date_str[:14], "%Y%m%d%H%M%S")  # Parse the date
-        return dt
+    try:
+        dt = datetime(
+            int(s[0:4]),
+            int(s[4:6] or 1),
+            int(s[6:8] or 1),
+            int(s[8:10] or 0),
+            int(s[10:12] or 0),
+            int(s[12:14] or 0),
+        )
+    except ValueError:
+        return None
+    return dt
 
-    doc = pymupdf.Document(pdf_path)
+
+def get_doc_dates(doc: pymupdf.Document) -> tuple[datetime, datetime]:
     creation_date = parse_pdf_date(doc.metadata.get("creationDate"))
     modified_date = parse_pdf_date(doc.metadata.get("modDate"))
     if creation_date is None:
@@ -25,24 +57,40 @@ def get_pdf_dates(pdf_path: str) -> tuple[datetime, datetime]:
     return creation_date, modified_date
 
 
-def get_pdf_text(pdf_path: str) -> str:
-    print(f"DEBUG: Extracting text from {pdf_path}")
-    doc = pymupdf.Document(pdf_path)
-    text_content = ""
+def get_doc_text(doc: pymupdf.Document, max_words: int | None = None, max_pages: int | None = None) -> str:
+    page_texts: list[str] = []
+    word_count = 0
 
-    for page_num in range(len(doc)):
+    # Walk pages lazily so only the pages actually needed are parsed;
+    # TEXTFLAGS_TEXT is plain text extraction without images or layout output
+    # max_pages bounds the work on documents that never reach max_words, e.g. scans
+    for page_num, page in enumerate(itertools.islice(doc, max_pages)):
         try:
-            page_text = doc[page_num].get_text()
-            text_content += page_text + " "
+            page_text = page.get_text("text", flags=pymupdf.TEXTFLAGS_TEXT)
+            page_texts.append(page_text)
         except Exception as e:
             print(f"DEBUG: Error on page {page_num}: {e}")
             continue
 
-    doc.close()
+        # Stop parsing further pages once enough words are collected
+        if max_words is not None:
+            word_count += len(page_text.split())
+            if word_count >= max_words:
+                break
+
+    text_content = " ".join(page_texts)
 
     # Clean up text: remove extra whitespace and normalize
-    import re
-    text_content = re.sub(r'\s+', ' ', text_content).strip()
+    text_content = _WHITESPACE_RE.sub(' ', text_content).strip()
+    return text_content
+
+
+def get_pdf_info(pdf_path: str, max_words: int | None = None, max_pages: int | None = None) -> tuple[datetime, datetime, str]:
+    # Dates and text from a single open of the file
+    print(f"DEBUG: Extracting text from {pdf_path}")
+    with pymupdf.open(pdf_path, filetype="pdf") as doc:
+        creation_date, modified_date = get_doc_dates(doc)
+        text_content = get_doc_text(doc, max_words=max_words, max_pages=max_pages)
 
     print(f"DEBUG: Extracted {len(text_content)} characters from {pdf_path}")
-    return text_content
\ No newline at end of file
+    return creation_date, modified_date, text_content